@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from binance.client import Client
 from binance.enums import SIDE_BUY, SIDE_SELL
 
@@ -6,8 +7,15 @@ from binance.enums import SIDE_BUY, SIDE_SELL
 API_KEY = os.getenv('BINANCE_API_KEY')
 API_SECRET = os.getenv('BINANCE_API_SECRET')
 
-# Initialize the Binance client
-client = Client(API_KEY, API_SECRET)
+@lru_cache(maxsize=1)
+def get_client():
+    """
+    Return the shared Binance client, creating it on first use.
+
+    The client is built once per process and reused across orders, so importing
+    this module no longer contacts Binance.
+    """
+    return Client(API_KEY, API_SECRET)
 
 def place_order(symbol, side, quantity):
     """
@@ -18,7 +26,7 @@ def place_order(symbol, side, quantity):
     :param quantity: Quantity to trade
     """
     try:
-        order = client.create_order(
+        order = get_client().create_order(
             symbol=symbol,
             side=SIDE_BUY if side.upper() == 'BUY' else SIDE_SELL,
             type='MARKET',
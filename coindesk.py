@@ -2,7 +2,6 @@ from datetime import datetime
 from typing import Optional, Generator
 
 import scrapy
-from typing import Optional
 
 def parse_iso_datetime(dt_str: str) -> Optional[datetime]:
     """
@@ -73,7 +72,8 @@ class CoindeskSpider(scrapy.Spider):
             parsed_dt = parse_iso_datetime(published_at)
             if not parsed_dt:
                 self.logger.error(
-                    f"Failed to parse 'published_at' ({published_at}) for article titled '{item.get('title')}'."
+                    "Failed to parse 'published_at' (%s) for article titled '%s'.",
+                    published_at, item.get("title")
                 )
                 continue
 
@@ -93,7 +93,7 @@ class CoindeskSpider(scrapy.Spider):
 
         published_datetime = parse_iso_datetime(datetime_str)
         if not published_datetime:
-            self.logger.error(f"Failed to parse datetime '{datetime_str}' in article.")
+            self.logger.error("Failed to parse datetime '%s' in article.", datetime_str)
             return None
 
         # Extract and clean the title.
@@ -1,16 +1,12 @@
 import os
-from dotenv import load_dotenv
-from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass, field
-import yaml
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 import json
-import redis
 from functools import lru_cache
 import logging
 from pathlib import Path
 import hashlib
-from datetime import datetime, timedelta
-import aiohttp
+import itertools
+from datetime import datetime
 import asyncio
 from ratelimit import limits, sleep_and_retry
 from enum import Enum
@@ -18,6 +14,21 @@ import pydantic
 from pydantic import BaseModel, field_validator
 import time
 
+__all__ = [
+    'logger',
+    'Environment', 'ProxyConfig', 'ScraperConfig', 'SentimentConfig', 'CacheConfig', 'Config',
+    'ConfigManager', 'get_manager', 'get_config',
+    'LOG_LEVEL', 'LOG_FILE',
+    'MAX_SCROLLS', 'DELAY_MIN', 'DELAY_MAX',
+    'PROXY_LIST', 'PROXY_USERNAME', 'PROXY_PASSWORD',
+    'RESULTS_DIR', 'ACCOUNTS', 'CRYPTO_KEYWORDS', 'USER_AGENTS', 'SENTIMENT_MODEL',
+]
+
+# Dependencias pesadas: se importan de forma diferida dentro de los métodos que las usan
+if TYPE_CHECKING:
+    import aiohttp
+    import redis
+
 # Configuración de logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,6 +36,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _json_codec():
+    """Devuelve las funciones (dumps, loads) para la caché, usando orjson si está instalado"""
+    try:
+        import orjson
+        return orjson.dumps, orjson.loads
+    except ImportError:
+        return json.dumps, json.loads
+
 class Environment(str, Enum):
     """Entornos de ejecución disponibles"""
     DEVELOPMENT = "development"
@@ -143,15 +162,18 @@ class ConfigManager:
         self.config_path = config_path
         self.environment = environment
         self._config: Optional[Config] = None
-        self._redis_client: Optional[redis.Redis] = None
+        self._redis_client: Optional["redis.Redis"] = None
         self._config_hash: Optional[str] = None
-        self._proxy_pool: List[str] = []
+        self._proxy_snapshot: Tuple[str, ...] = ()
+        self._proxy_idx = itertools.count()
         self._proxy_last_rotation: Optional[datetime] = None
         self._proxy_lock = asyncio.Lock()
         self._load_dotenv()
     
     def _load_dotenv(self):
         """Carga variables de entorno según el ambiente"""
+        from dotenv import load_dotenv
+
         env_file = f".env.{self.environment.value}"
         if Path(env_file).exists():
             load_dotenv(env_file)
@@ -167,6 +189,8 @@ class ConfigManager:
 
     def _load_config(self):
         """Carga la configuración desde el archivo con manejo de errores mejorado"""
+        import yaml
+
         try:
             if not Path(self.config_path).exists():
                 raise FileNotFoundError(f"Archivo de configuración no encontrado: {self.config_path}")
@@ -204,11 +228,13 @@ class ConfigManager:
             self._cache_config()
             
         except Exception as e:
-            logger.error(f"Error al cargar configuración: {str(e)}", exc_info=True)
+            logger.error("Error al cargar configuración: %s", e, exc_info=True)
             raise
     
-    def _get_redis_client(self) -> redis.Redis:
+    def _get_redis_client(self) -> "redis.Redis":
         """Obtiene el cliente de Redis con manejo de errores mejorado"""
+        import redis
+
         if self._redis_client is None:
             try:
                 self._redis_client = redis.Redis(
@@ -232,10 +258,10 @@ class ConfigManager:
                 )
                 
             except redis.ConnectionError as e:
-                logger.error(f"Error de conexión con Redis: {str(e)}", exc_info=True)
+                logger.error("Error de conexión con Redis: %s", e, exc_info=True)
                 raise
             except Exception as e:
-                logger.error(f"Error al configurar Redis: {str(e)}", exc_info=True)
+                logger.error("Error al configurar Redis: %s", e, exc_info=True)
                 raise
         
         return self._redis_client
@@ -243,6 +269,7 @@ class ConfigManager:
     def _get_cached_config(self) -> Optional[Config]:
         """Obtiene la configuración desde caché con manejo de errores mejorado"""
         try:
+            _, json_loads = _json_codec()
             redis_client = self._get_redis_client()
             
             # Obtener configuración cacheada
@@ -251,9 +278,9 @@ class ConfigManager:
                 return None
             
             try:
-                cached_config = json.loads(cached_data)
+                cached_config = json_loads(cached_data)
             except json.JSONDecodeError as e:
-                logger.error(f"Error al decodificar configuración cacheada: {str(e)}")
+                logger.error("Error al decodificar configuración cacheada: %s", e)
                 return None
             
             # Verificar hash
@@ -272,16 +299,19 @@ class ConfigManager:
                     **cached_config['app']
                 )
             except pydantic.ValidationError as e:
-                logger.error(f"Error de validación en configuración cacheada: {str(e)}")
+                logger.error("Error de validación en configuración cacheada: %s", e)
                 return None
             
         except Exception as e:
-            logger.error(f"Error al obtener configuración cacheada: {str(e)}", exc_info=True)
+            logger.error("Error al obtener configuración cacheada: %s", e, exc_info=True)
             return None
     
     def _cache_config(self):
         """Guarda la configuración en caché con manejo de errores mejorado"""
+        import redis
+
         try:
+            json_dumps, _ = _json_codec()
             redis_client = self._get_redis_client()
             
             # Convertir a diccionario
@@ -304,14 +334,14 @@ class ConfigManager:
                 redis_client.setex(
                     'sentiment_config',
                     self.config.cache.default_ttl,
-                    json.dumps(config_dict)
+                    json_dumps(config_dict)
                 )
                 logger.info("Configuración guardada en caché exitosamente")
             except redis.RedisError as e:
-                logger.error(f"Error al guardar en Redis: {str(e)}")
+                logger.error("Error al guardar en Redis: %s", e)
             
         except Exception as e:
-            logger.error(f"Error al cachear configuración: {str(e)}", exc_info=True)
+            logger.error("Error al cachear configuración: %s", e, exc_info=True)
     
     @lru_cache(maxsize=100)
     def get_setting(self, key: str) -> Any:
@@ -336,7 +366,7 @@ class ConfigManager:
             return value
             
         except Exception as e:
-            logger.error(f"Error al obtener configuración {key}: {str(e)}", exc_info=True)
+            logger.error("Error al obtener configuración %s: %s", key, e, exc_info=True)
             raise ValueError(f"Error al obtener configuración {key}: {str(e)}")
     
     async def get_proxy(self) -> Optional[str]:
@@ -350,33 +380,38 @@ class ConfigManager:
             Exception: Si hay un error al obtener el proxy
         """
         try:
-            async with self._proxy_lock:
-                # Verificar si necesitamos rotar proxies
-                if (self._proxy_last_rotation is None or
-                        (datetime.now() - self._proxy_last_rotation
-                         ).total_seconds() > self.config.proxy.rotation_interval):
-                    await self._rotate_proxies()
-                
-                # Verificar si tenemos suficientes proxies
-                if len(self._proxy_pool) < self.config.proxy.min_working_proxies:
-                    await self._rotate_proxies()
-                
-                if not self._proxy_pool:
-                    logger.warning("No hay proxies disponibles en el pool")
-                    return None
-                
-                # Obtener siguiente proxy
-                proxy = self._proxy_pool.pop(0)
-                self._proxy_pool.append(proxy)
-                
-                return proxy
+            # El lock solo se toma para rotar; la lectura del pool no lo necesita
+            if self._proxy_rotation_due():
+                async with self._proxy_lock:
+                    # Otra tarea pudo haber rotado mientras esperábamos el lock
+                    if self._proxy_rotation_due():
+                        await self._rotate_proxies()
+            
+            snapshot = self._proxy_snapshot
+            if not snapshot:
+                logger.warning("No hay proxies disponibles en el pool")
+                return None
+            
+            # Obtener siguiente proxy (round-robin sobre el snapshot inmutable)
+            return snapshot[next(self._proxy_idx) % len(snapshot)]
                 
         except Exception as e:
-            logger.error(f"Error al obtener proxy: {str(e)}", exc_info=True)
+            logger.error("Error al obtener proxy: %s", e, exc_info=True)
             raise
     
+    def _proxy_rotation_due(self) -> bool:
+        """Indica si el pool de proxies debe rotarse (intervalo vencido o pool insuficiente)"""
+        if self._proxy_last_rotation is None:
+            return True
+        elapsed = (datetime.now() - self._proxy_last_rotation).total_seconds()
+        if elapsed > self.config.proxy.rotation_interval:
+            return True
+        return len(self._proxy_snapshot) < self.config.proxy.min_working_proxies
+    
     async def _rotate_proxies(self):
         """Rota y verifica la salud de los proxies con manejo de errores mejorado"""
+        import aiohttp
+
         try:
             # Obtener lista de proxies
             proxies = self.config.proxy.proxy_list.copy()
@@ -394,27 +429,27 @@ class ConfigManager:
                 
                 results = await asyncio.gather(*tasks, return_exceptions=True)
                 
-                # Filtrar proxies saludables
-                self._proxy_pool = [
+                # Filtrar proxies saludables y publicar el snapshot con una única asignación
+                self._proxy_snapshot = tuple(
                     proxy for proxy, is_healthy in zip(proxies, results)
                     if isinstance(is_healthy, bool) and is_healthy
-                ]
+                )
             
             self._proxy_last_rotation = datetime.now()
             
-            if not self._proxy_pool:
+            if not self._proxy_snapshot:
                 logger.error("No se encontraron proxies saludables")
             else:
-                logger.info(f"Pool de proxies actualizado: {len(self._proxy_pool)} proxies saludables")
+                logger.info("Pool de proxies actualizado: %s proxies saludables", len(self._proxy_snapshot))
             
             # Iniciar verificación periódica
             asyncio.create_task(self._periodic_health_check())
             
         except Exception as e:
-            logger.error(f"Error al rotar proxies: {str(e)}", exc_info=True)
+            logger.error("Error al rotar proxies: %s", e, exc_info=True)
             raise
     
-    async def _check_proxy_health(self, session: aiohttp.ClientSession,
+    async def _check_proxy_health(self, session: "aiohttp.ClientSession",
                                 proxy: str) -> bool:
         """
         Verifica la salud de un proxy con timeout y reintentos
@@ -437,9 +472,9 @@ class ConfigManager:
                         return True
                     
             except asyncio.TimeoutError:
-                logger.warning(f"Timeout al verificar proxy {proxy}")
+                logger.warning("Timeout al verificar proxy %s", proxy)
             except Exception as e:
-                logger.warning(f"Error al verificar proxy {proxy}: {str(e)}")
+                logger.warning("Error al verificar proxy %s: %s", proxy, e)
             
             if attempt < self.config.proxy.max_retries - 1:
                 await asyncio.sleep(self.config.proxy.retry_delay)
@@ -452,12 +487,15 @@ class ConfigManager:
             try:
                 await asyncio.sleep(self.config.proxy.health_check_interval)
                 
-                if len(self._proxy_pool) < self.config.proxy.min_working_proxies:
-                    logger.warning("Pool de proxies por debajo del mínimo, iniciando rotación")
-                    await self._rotate_proxies()
+                if len(self._proxy_snapshot) < self.config.proxy.min_working_proxies:
+                    async with self._proxy_lock:
+                        # get_proxy pudo haber rotado mientras esperábamos el lock
+                        if len(self._proxy_snapshot) < self.config.proxy.min_working_proxies:
+                            logger.warning("Pool de proxies por debajo del mínimo, iniciando rotación")
+                            await self._rotate_proxies()
                     
             except Exception as e:
-                logger.error(f"Error en verificación periódica de proxies: {str(e)}", exc_info=True)
+                logger.error("Error en verificación periódica de proxies: %s", e, exc_info=True)
                 await asyncio.sleep(self.config.proxy.retry_delay)
     
     @sleep_and_retry
@@ -469,6 +507,8 @@ class ConfigManager:
         Raises:
             Exception: Si se excede el rate limit
         """
+        import redis
+
         try:
             current = int(time.time())
             key = f"sentiment_rate:{current // 60}"
@@ -482,10 +522,10 @@ class ConfigManager:
                 raise Exception("Rate limit exceeded")
                 
         except redis.RedisError as e:
-            logger.error(f"Error de Redis al verificar rate limit: {str(e)}", exc_info=True)
+            logger.error("Error de Redis al verificar rate limit: %s", e, exc_info=True)
             raise
         except Exception as e:
-            logger.error(f"Error al verificar rate limit: {str(e)}", exc_info=True)
+            logger.error("Error al verificar rate limit: %s", e, exc_info=True)
             raise
     
     def clear_cache(self):
@@ -503,7 +543,7 @@ class ConfigManager:
             logger.info("Caché de configuración limpiada exitosamente")
             
         except Exception as e:
-            logger.error(f"Error al limpiar caché: {str(e)}", exc_info=True)
+            logger.error("Error al limpiar caché: %s", e, exc_info=True)
             raise
     
     def validate_config(self) -> bool:
@@ -543,7 +583,7 @@ class ConfigManager:
             return True
             
         except Exception as e:
-            logger.error(f"Error al validar configuración: {str(e)}", exc_info=True)
+            logger.error("Error al validar configuración: %s", e, exc_info=True)
             raise ValueError(f"Error de validación: {str(e)}")
     
     def close(self):
@@ -554,11 +594,29 @@ class ConfigManager:
                 self._redis_client = None
                 logger.info("Conexiones cerradas exitosamente")
         except Exception as e:
-            logger.error(f"Error al cerrar conexiones: {str(e)}", exc_info=True)
+            logger.error("Error al cerrar conexiones: %s", e, exc_info=True)
             raise
 
-# Instancia global del gestor de configuración
-config_manager = ConfigManager()
+# Instancia global del gestor de configuración, creada en el primer acceso
+@lru_cache(maxsize=1)
+def get_manager() -> ConfigManager:
+    """
+    Obtiene el gestor de configuración global, creándolo en el primer acceso
+
+    Carga las variables de entorno y crea el directorio de resultados solo
+    cuando se necesita, en lugar de hacerlo al importar el módulo.
+
+    Returns:
+        ConfigManager: Instancia compartida del gestor de configuración
+    """
+    from dotenv import load_dotenv
+
+    # El gestor carga primero el .env del entorno; load_dotenv no sobrescribe
+    # variables ya definidas, así que .env solo completa las que falten
+    manager = ConfigManager()
+    load_dotenv()
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    return manager
 
 # Función helper para obtener configuración
 def get_config(key: str) -> Any:
@@ -575,31 +633,44 @@ def get_config(key: str) -> Any:
         ValueError: Si la clave no existe o es inválida
     """
     try:
-        return config_manager.get_setting(key)
+        return get_manager().get_setting(key)
     except Exception as e:
-        logger.error(f"Error al obtener configuración {key}: {str(e)}", exc_info=True)
+        logger.error("Error al obtener configuración %s: %s", key, e, exc_info=True)
         raise ValueError(f"Error al obtener configuración {key}: {str(e)}")
 
-# Cargar variables de entorno
-load_dotenv()
+# Configuración leída de variables de entorno. Se resuelve en el primer acceso,
+# después de que get_manager() haya cargado los archivos .env
+_ENV_SETTINGS = {
+    # Configuración de logging
+    'LOG_LEVEL': lambda: os.getenv('LOG_LEVEL', 'INFO'),
+    # Configuración de scraping
+    'MAX_SCROLLS': lambda: int(os.getenv('MAX_SCROLLS', '50')),
+    'DELAY_MIN': lambda: float(os.getenv('DELAY_MIN', '2')),
+    'DELAY_MAX': lambda: float(os.getenv('DELAY_MAX', '5')),
+    # Configuración de proxies
+    'PROXY_LIST': lambda: os.getenv('PROXY_LIST', '').split(','),
+    'PROXY_USERNAME': lambda: os.getenv('PROXY_USERNAME', ''),
+    'PROXY_PASSWORD': lambda: os.getenv('PROXY_PASSWORD', ''),
+}
+
+def __getattr__(name: str) -> Any:
+    """Resuelve la configuración de entorno en el primer acceso y la guarda en el módulo"""
+    if name not in _ENV_SETTINGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    get_manager()
+    value = _ENV_SETTINGS[name]()
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """Incluye la configuración de entorno aún no resuelta en dir()"""
+    return sorted(set(globals()) | set(_ENV_SETTINGS))
 
 # Configuración de logging
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOG_FILE = 'crypto_sentiment.log'
 
-# Configuración de scraping
-MAX_SCROLLS = int(os.getenv('MAX_SCROLLS', '50'))
-DELAY_MIN = float(os.getenv('DELAY_MIN', '2'))
-DELAY_MAX = float(os.getenv('DELAY_MAX', '5'))
-
-# Configuración de proxies
-PROXY_LIST = os.getenv('PROXY_LIST', '').split(',')
-PROXY_USERNAME = os.getenv('PROXY_USERNAME', '')
-PROXY_PASSWORD = os.getenv('PROXY_PASSWORD', '')
-
 # Configuración de directorios
 RESULTS_DIR = 'results'
-os.makedirs(RESULTS_DIR, exist_ok=True)
 
 # Configuración de cuentas a analizar
 ACCOUNTS = {